@@ -194,7 +194,7 @@ def encode(zone, hemipole=NN, band=NN):
               <https://GeographicLib.SourceForge.io/html/classGeographicLib_1_1UTMUPS.html>}.
     '''
     try:
-        z, B, hp = _to3zBhp(zone, band, hemipole=hemipole)  # in .ellipsoidalBase
+        z, B, hp = _to3zBhp(zone, band, hemipole)  # in .ellipsoidalBase
         if hp not in _NS_:
             raise ValueError
     except (TypeError, ValueError) as x:
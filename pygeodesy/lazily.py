@@ -175,8 +175,9 @@ _ALL_LAZY = _NamedEnum_RO(_name='_ALL_LAZY',
                                  'unroll180', 'unrollPI',
                                  'wrap90', 'wrap180', 'wrap360', 'wrapPI_2','wrapPI', 'wrapPI2'),
                             utm=('Utm', 'UTMError', 'parseUTM5', 'toUtm8', 'utmZoneBand5'),
-                         utmups=('UtmUps', 'UTMUPSError', 'parseUTMUPS5', 'toUtmUps8',
-                                 'utmupsValidate', 'utmupsValidateOK', 'utmupsZoneBand5'),
+                         utmups=('UtmUps', 'UTMUPSError', 'parseUTMUPS5', 'toUtmUps8', 'toUtmUps8_array',
+                                 'utmupsValidate', 'utmupsValidate_array', 'utmupsValidateOK',
+                                 'utmupsZoneBand5'),
                        vector3d=('Vector3d', 'VectorError'),  # nothing else
                     webmercator=('Wm', 'WebMercatorError', 'parseWM', 'toWm'),
                            wgrs=('Georef', 'WGRSError'))
@@ -103,7 +103,7 @@ class Ups(UtmUpsBase):
             self.name = name
 
         try:
-            z, B, p = _to3zBhp(zone, band, hemipole=pole)
+            z, B, p = _to3zBhp(zone, band, pole)
             if z != _UPS_ZONE or (B and B not in _Bands):
                 raise ValueError
         except (TypeError, ValueError) as x:
@@ -450,6 +450,56 @@ def toUps8(latlon, lon=None, datum=None, Ups=Ups, pole=NN,
     return _xnamed(r, name)
 
 
+def _toUps_vec(lat, lon, E, falsed, pole=NN):  # imported by .utmups
+    '''(INTERNAL) Vectorized L{toUps8} for C{numpy} arrays of UPS
+       lat- and longitudes, see function L{toUtmUps8_array}.
+
+       @arg lat: Latitudes in the UPS range (C{degrees}).
+       @arg lon: Longitudes, wrapped (C{degrees180}).
+       @arg E: The ellipsoid (L{Ellipsoid}).
+       @arg falsed: False both easting and northing (C{bool}).
+       @kwarg pole: Optional top/center of (stereographic) projection
+                    (C{str}, C{'N[orth]'} or C{'S[outh]'}).
+
+       @return: 7-Tuple (zone, pole, easting, northing, band,
+                convergence, scale) of C{numpy} arrays.
+    '''
+    import numpy as np
+
+    S = lat < 0
+    B = np.array(_Bands)[np.where(S, 0, 2) + np.where(lon < 0, 0, 1)]
+    if pole:
+        N = np.full(lat.shape, str(pole)[:1].upper() == _N_)
+    else:
+        N = ~S
+    p = np.where(N, _N_, _S_)
+
+    a = np.where(N, lat, -lat)
+    A = np.abs(a - 90) < _TOL  # at pole
+
+    t = np.tan(np.radians(a))
+    t1 = np.hypot(t, 1)
+    s = t / t1  # E.es_taupf(t)
+    s = np.sinh(E.e * (np.arctanh(E.e * s) if E.f > 0 else np.arctan(-E.e * s)))
+    T = np.hypot(s, 1) * t - s * t1
+
+    r = np.hypot(T, 1) + np.abs(T)
+    r = np.where(T >= 0, np.where(A, 0, 1 / r), r)
+    r = r * (2 * _K0 * E.a / E.es_c)
+
+    k = np.where(A, _K0, (r / E.a) * t1 * np.sqrt(E.e12 + E.e2 / t1**2))
+    c = np.radians(lon)  # [-180, 180) from .utmups
+    x = np.sin(c) * r
+    y = np.cos(c) * r
+    y = np.where(N, -y, y)
+    c = np.where(N, lon, -lon)
+
+    if falsed:
+        x = x + _Falsing
+        y = y + _Falsing
+    return np.full(lat.shape, _UPS_ZONE), p, x, y, B, c, k
+
+
 def upsZoneBand5(lat, lon, strict=True):
     '''Return the UTM/UPS zone number, (polar) Band letter, pole and
        clipped lat- and longitude for a given location.
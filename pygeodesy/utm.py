@@ -30,6 +30,10 @@ U{Transverse Mercator Projection<https://GeographicLib.SourceForge.io/tm.html>}
 and Henrik Seidel U{'Die Mathematik der Gauß-Krueger-Abbildung'
 <https://Henrik-Seidel.GMXhome.DE/gausskrueger.pdf>}, 2006.
 
+To compile the UTM forward projection with U{numba<https://PyPI.org/project/numba>},
+set environment variable C{PYGEODESY_NUMBA} to a non-empty string I{before}
+importing this module.
+
 @newfield example: Example, Examples
 '''
 
@@ -38,10 +42,10 @@ from pygeodesy.datum import Datums
 from pygeodesy.dms import degDMS, parseDMS2
 from pygeodesy.errors import RangeError, _ValueError, _xkwds_get
 from pygeodesy.fmath import fdot3, Fsum, hypot, hypot1
-from pygeodesy.interns import _COMMA_SPACE_, _Missing, NN, _NS_, \
+from pygeodesy.interns import _COMMA_SPACE_, _Missing, _N_, NN, _NS_, \
                               _outside_, _range_, _S_, _SPACE_, \
                               _SQUARE_, _UTM_, _zone_  # PYCHOK used!
-from pygeodesy.lazily import _ALL_LAZY
+from pygeodesy.lazily import _ALL_LAZY, _environ
 from pygeodesy.named import EasNor2Tuple, _xnamed
 from pygeodesy.units import Band, Int, Lat, Lon, Zone
 from pygeodesy.utily import degrees90, degrees180, sincos2  # splice
@@ -54,12 +58,25 @@ from pygeodesy.utmupsBase import _LLEB, _hemi, _parseUTMUPS5, \
                                   UtmUpsLatLon5Tuple  # PYCHOK indent
 
 from math import asinh, atan, atanh, atan2, cos, cosh, \
-                 degrees, radians, sin, sinh, tan, tanh
+                 degrees, radians, sin, sinh, sqrt, tan, tanh
 from operator import mul
 
 __all__ = _ALL_LAZY.utm
 __version__ = '20.07.08'
 
+_guvectorize = _njit = None
+if _environ.get('PYGEODESY_NUMBA', None):  # opt-in, importing numba is slow
+    try:
+        from numba import guvectorize as _guvectorize, njit as _njit
+    except ImportError:  # PYCHOK no cover
+        pass
+if _njit is None:
+
+    def _njit(**unused):  # PYCHOK expected
+        '''(INTERNAL) No-op C{numba.njit} decorator.
+        '''
+        return lambda f: f
+
 # Latitude bands C..X of 8° each, covering 80°S to 84°N with X repeated
 # for 80-84°N
 _Bands         = 'CDEFGHJKLMNPQRSTUVWXX'  #: (INTERNAL) Latitude bands.
@@ -127,6 +144,9 @@ class _Kseries(object):
         return fdot3(self._pq, self._sy, self._shx, start=q0)
 
 
+_lon90_txt = _SPACE_.join((_outside_, _UTM_, _range_))  # 90 degrees off
+
+
 def _cmlon(zone):
     '''(INTERNAL) Central meridian longitude (C{degrees180}).
     '''
@@ -627,7 +647,9 @@ def toUtm8(latlon, lon=None, datum=None, Utm=Utm, falsed=True, name=NN,
 
        @raise RangeError: If B{C{lat}} outside the valid UTM bands or
                           if B{C{lat}} or B{C{lon}} outside the valid
-                          range and L{rangerrors} set to C{True}.
+                          range and L{rangerrors} set to C{True} or if
+                          B{C{lon}} is 90 degrees off the (central)
+                          meridian.
 
        @raise UTMError: Invalid B{C{zone}}.
 
@@ -649,37 +671,82 @@ def toUtm8(latlon, lon=None, datum=None, Utm=Utm, falsed=True, name=NN,
                                              falsed, name, zone,
                                              UTMError, **cmoff)
     E = d.ellipsoid
+    A0 = E.A * getattr(Utm, '_scale0', _K0)  # Utm is class or None
 
     a, b = radians(lat), radians(lon)
+    if abs(cos(b)) < EPS:  # 90 degrees off, singular
+        raise RangeError(lon=degDMS(lon), txt=_lon90_txt)
+
+    x, y, c, k = _toUtm4(a, b, E.e, E.e2,
+                         A0, A0 / E.a, tuple(E.AlphaKs))
+
+    return _toXtm8(Utm, z, lat, x, y,
+                        B, d, c, k, f, name, latlon, EPS)
+
+
+@_njit(cache=True)
+def _toUtm4(a, b, e, e2, A0, A0_a, AKs):
+    '''(INTERNAL) Forward UTM projection for L{toUtm8}, only
+       C{float} arithmetic, C{numba.njit}-compiled if enabled.
+
+       @arg a: Latitude (C{radians}).
+       @arg b: Longitude off the central meridian (C{radians}).
+       @arg e: Ellipsoid eccentricity (C{float}).
+       @arg e2: Ellipsoid eccentricity I{squared} (C{float}).
+       @arg A0: Meridional radius times central scale (C{meter}).
+       @arg A0_a: B{C{A0}} over the equatorial radius (C{float}).
+       @arg AKs: Krüger Alpha series coefficients (C{tuple}).
+
+       @return: 4-Tuple (easting, northing, convergence, scale)
+                unfalsed in C{meter}, C{meter}, C{degrees} and
+                C{float}.
+    '''
     # easting, northing: Karney 2011 Eq 7-14, 29, 35
-    sb, cb = sincos2(b)
+    sb, cb = sin(b), cos(b)
 
     T = tan(a)
-    T12 = hypot1(T)
-    S = sinh(E.e * atanh(E.e * T / T12))
+    T12 = hypot(1.0, T)
+    S = sinh(e * atanh(e * T / T12))
 
-    T_ = T * hypot1(S) - S * T12
+    T_ = T * hypot(1.0, S) - S * T12
     H = hypot(T_, cb)
 
     y = atan2(T_, cb)  # ξ' ksi
     x = asinh(sb / H)  # η' eta
 
-    A0 = E.A * getattr(Utm, '_scale0', _K0)  # Utm is class or None
-
-    K = _Kseries(E.AlphaKs, x, y)  # Krüger series
-    y = K.ys(y) * A0  # ξ
-    x = K.xs(x) * A0  # η
+    # Krüger series, see class _Kseries
+    x_, y_, p_, q_ = x, y, 1.0, 0.0
+    for j in range(len(AKs)):
+        j2 = (j + 1) * 2.0
+        cy, sy = cos(j2 * y), sin(j2 * y)
+        chx, shx = cosh(j2 * x), sinh(j2 * x)
+        AK = AKs[j]
+        x_ += AK * cy * shx
+        y_ += AK * sy * chx
+        p_ += AK * cy * chx * j2
+        q_ += AK * sy * shx * j2
 
     # convergence: Karney 2011 Eq 23, 24
-    p_ = K.ps(1)
-    q_ = K.qs(0)
-    c = degrees(atan(T_ / hypot1(T_) * tan(b)) + atan2(q_, p_))
+    c = degrees(atan(T_ / hypot(1.0, T_) * tan(b)) + atan2(q_, p_))
 
     # scale: Karney 2011 Eq 25
-    k = E.e2s(sin(a)) * T12 / H * (A0 / E.a * hypot(p_, q_))
+    k = sqrt(1 - e2 * sin(a)**2) * T12 / H * (A0_a * hypot(p_, q_))
 
-    return _toXtm8(Utm, z, lat, x, y,
-                        B, d, c, k, f, name, latlon, EPS)
+    return x_ * A0, y_ * A0, c, k
+
+
+if _guvectorize:
+
+    @_guvectorize(['void(f8, f8, f8, f8, f8, f8, f8[:], f8[:], f8[:], f8[:], f8[:])'],
+                  '(),(),(),(),(),(),(m)->(),(),(),()', nopython=True, target='parallel')
+    def _toUtm4_gu(a, b, e, e2, A0, A0_a, AKs, x, y, c, k):  # PYCHOK 11 args
+        '''(INTERNAL) Generalized, multi-threaded C{numpy} ufunc of
+           L{_toUtm4} for arrays of any shape, see L{_toUtm_vec}.
+        '''
+        x[0], y[0], c[0], k[0] = _toUtm4(a, b, e, e2, A0, A0_a, AKs)
+
+else:
+    _toUtm4_gu = None
 
 
 def _toXtm8(Xtm, z, lat, x, y, B, d, c, k, f,  # PYCHOK 13+ args
@@ -700,6 +767,92 @@ def _toXtm8(Xtm, z, lat, x, y, B, d, c, k, f,  # PYCHOK 13+ args
     return _xnamed(r, name)
 
 
+def _toUtm4_np(a, b, E, A0):
+    '''(INTERNAL) Vectorized L{_toUtm4} using C{numpy} expressions.
+    '''
+    import numpy as np
+
+    # easting, northing: Karney 2011 Eq 7-14, 29, 35
+    sb, cb = np.sin(b), np.cos(b)
+
+    T = np.tan(a)
+    T12 = np.hypot(T, 1)
+    S = np.sinh(E.e * np.arctanh(E.e * T / T12))
+
+    T_ = T * np.hypot(S, 1) - S * T12
+    H = np.hypot(T_, cb)
+
+    y = np.arctan2(T_, cb)  # ξ' ksi
+    x = np.arcsinh(sb / H)  # η' eta
+
+    # Krüger series, see class _Kseries
+    p_, q_, x0, y0 = 1, 0, x, y
+    for j, AB in enumerate(E.AlphaKs, 1):
+        j2 = j * 2
+        cy, sy = np.cos(j2 * y0), np.sin(j2 * y0)
+        chx, shx = np.cosh(j2 * x0), np.sinh(j2 * x0)
+        x = x + AB * cy * shx
+        y = y + AB * sy * chx
+        p_ = p_ + j2 * AB * cy * chx
+        q_ = q_ + j2 * AB * sy * shx
+
+    y = y * A0  # ξ
+    x = x * A0  # η
+
+    # convergence: Karney 2011 Eq 23, 24
+    c = np.degrees(np.arctan(T_ / np.hypot(T_, 1) * np.tan(b)) + np.arctan2(q_, p_))
+
+    # scale: Karney 2011 Eq 25
+    k = np.sqrt(1 - E.e2 * np.sin(a)**2) * T12 / H * (A0 / E.a * np.hypot(p_, q_))
+
+    return x, y, c, k
+
+
+def _toUtm_vec(lat, lon, E, falsed):  # imported by .utmups
+    '''(INTERNAL) Vectorized L{toUtm8} for C{numpy} arrays of UTM
+       lat- and longitudes, see function L{toUtmUps8_array}.
+
+       @arg lat: Latitudes in the UTM range (C{degrees}).
+       @arg lon: Longitudes, wrapped (C{degrees180}).
+       @arg E: The ellipsoid (L{Ellipsoid}).
+       @arg falsed: False both easting and northing (C{bool}).
+
+       @return: 7-Tuple (zone, hemisphere, easting, northing,
+                band, convergence, scale) of C{numpy} arrays.
+    '''
+    import numpy as np
+
+    # zone and Band, like _to3zll and _to3zBll
+    z = np.clip((lon + 180) // 6 + 1, _UTM_ZONE_MIN, _UTM_ZONE_MAX).astype(int)
+    B = np.clip((lat - _UTM_LAT_MIN) // 8, 0, len(_Bands) - 1).astype(int)
+    B = np.array(tuple(_Bands))[B]
+
+    X, Z = B == 'X', z.copy()
+    for r, x in ((32, 9), (34, 21), (36, 33)):  # Svalbard
+        z = np.where(X & (Z == r), np.where(lon >= x, r + 1, r - 1), z)
+    z = np.where((B == 'V') & (Z == 31) & (lon >= 3), 32, z)  # SouthWestern Norway
+
+    if falsed:  # lon off central meridian, like _to3zBll
+        lon = lon - _cmlon(z)
+    a, b = np.radians(lat), np.radians(lon)
+    i = np.flatnonzero(np.abs(np.cos(b)) < EPS)
+    if i.size:  # 90 degrees off, singular
+        raise RangeError(lon=degDMS(float(lon.flat[i[0]])), txt=_lon90_txt)
+    A0 = E.A * _K0
+    if _toUtm4_gu:  # numba ufunc
+        x, y, c, k = _toUtm4_gu(a, b, E.e, E.e2, A0, A0 / E.a,
+                                np.array(E.AlphaKs))
+    else:
+        x, y, c, k = _toUtm4_np(a, b, E, A0)
+
+    S = lat < 0
+    h = np.where(S, _S_, _N_)
+    if falsed:
+        x = x + _FalseEasting
+        y = np.where(S, y + _FalseNorthing, y)
+    return z, h, x, y, B, c, k
+
+
 def utmZoneBand5(lat, lon, cmoff=False):
     '''Return the UTM zone number, Band letter, hemisphere and
        (clipped) lat- and longitude for a given location.
@@ -1,8 +1,9 @@
 
 # -*- coding: utf-8 -*-
 
-u'''Functions L{parseUTMUPS5}, L{toUtmUps8},  L{UtmUps} and
-L{utmupsZoneBand5} to handle both I{Universal Transverse Mercator
+u'''Functions L{parseUTMUPS5}, L{toUtmUps8}, L{toUtmUps8_array}, L{UtmUps},
+L{utmupsValidate_array} and L{utmupsZoneBand5} to handle both I{Universal
+Transverse Mercator
 (U{UTM<https://WikiPedia.org/wiki/Universal_Transverse_Mercator_coordinate_system>})}
 and I{Universal Polar Stereographic
 (U{UPS<https://WikiPedia.org/wiki/Universal_polar_stereographic_coordinate_system>})}
@@ -13,17 +14,22 @@ A pure Python implementation, partially transcribed from C++ class U{UTMUPS
 by I{Charles Karney}.
 '''
 
-from pygeodesy.basics import map1
+from pygeodesy.basics import isstr, map1
 from pygeodesy.datum import Datums
-from pygeodesy.errors import _IsnotError, RangeError, _ValueError, _xkwds_get
-from pygeodesy.interns import _easting_, _MGRS_, NN, _northing_, _NS_, \
-                              _outside_, _range_, _SPACE_, _UPS_, _UTM_
+from pygeodesy.dms import parseDMS2
+from pygeodesy.errors import _IsnotError, LenError, RangeError, \
+                             _ValueError
+from pygeodesy.interns import _COMMA_, _easting_, _MGRS_, NN, _northing_, \
+                              _NS_, _outside_, _range_, _SPACE_, _UPS_, _UTM_
 from pygeodesy.lazily import _ALL_LAZY
-from pygeodesy.named import modulename
-from pygeodesy.ups import parseUPS5, toUps8, Ups, UPSError, upsZoneBand5
-from pygeodesy.utm import parseUTM5, toUtm8, Utm, UTMError, utmZoneBand5
+from pygeodesy.named import modulename, _xnamed
+from pygeodesy.ups import _Bands as _UPS_Bands, parseUPS5, toUps8, \
+                         _toUps_vec, Ups, UPSError, upsZoneBand5
+from pygeodesy.utm import _Bands as _UTM_Bands, parseUTM5, toUtm8, \
+                         _toUtm_vec, Utm, UTMError, utmZoneBand5
 from pygeodesy.utmupsBase import _MGRS_TILE, _to4lldn, _to3zBhp, \
                                  _UPS_ZONE, _UPS_ZONE_STR, \
+                                 _UTM_LAT_MAX, _UTM_LAT_MIN, \
                                  _UTMUPS_ZONE_MIN, _UTMUPS_ZONE_MAX, \
                                   UtmUps5Tuple, UtmUps8Tuple  # PYCHOK indent
 
@@ -45,20 +51,12 @@ _UTM_S_MIN =  10 * _MGRS_TILE
 _UTM_N_SHIFT = _UTM_S_MAX - _UTM_N_MIN  # South minus North UTM northing
 
 
-class _UpsMinMax(object):  # XXX _NamedEnum or _NamedTuple
-    # UPS ranges for North, South pole
-    eMax = _UPS_N_MAX, _UPS_S_MAX
-    eMin = _UPS_N_MIN, _UPS_S_MIN
-    nMax = _UPS_N_MAX, _UPS_S_MAX
-    nMin = _UPS_N_MIN, _UPS_S_MIN
-
-
-class _UtmMinMax(object):  # XXX _NamedEnum or _NamedTuple
-    # UTM ranges for Northern, Southern hemisphere
-    eMax =  _UTM_C_MAX, _UTM_C_MAX
-    eMin =  _UTM_C_MIN, _UTM_C_MIN
-    nMax =  _UTM_N_MAX, (_UTM_N_MAX + _UTM_N_SHIFT)
-    nMin = (_UTM_S_MIN - _UTM_N_SHIFT), _UTM_S_MIN
+# UPS ranges (eMin, eMax, nMin, nMax) for North, South pole
+_UPS_RANGES = ((_UPS_N_MIN, _UPS_N_MAX, _UPS_N_MIN, _UPS_N_MAX),
+               (_UPS_S_MIN, _UPS_S_MAX, _UPS_S_MIN, _UPS_S_MAX))
+# UTM ranges (eMin, eMax, nMin, nMax) for Northern, Southern hemisphere
+_UTM_RANGES = ((_UTM_C_MIN, _UTM_C_MAX, _UTM_S_MIN - _UTM_N_SHIFT, _UTM_N_MAX),
+               (_UTM_C_MIN, _UTM_C_MAX, _UTM_S_MIN, _UTM_N_MAX + _UTM_N_SHIFT))
 
 
 class UTMUPSError(_ValueError):  # XXX (UTMError, UPSError)
@@ -68,6 +66,16 @@ class UTMUPSError(_ValueError):  # XXX (UTMError, UPSError)
     pass
 
 
+def _isUPSzone(strUTMUPS):
+    '''(INTERNAL) Is the zone of B{C{strUTMUPS}} C{"00"}, with or
+       without a Band letter?
+    '''
+    z = strUTMUPS.replace(_COMMA_, _SPACE_).split()
+    z = z[0] if z else NN
+    return z[:2] == _UPS_ZONE_STR and (len(z) == 2 or
+                                      (len(z) == 3 and z[2].isalpha()))
+
+
 def parseUTMUPS5(strUTMUPS, datum=Datums.WGS84, Utm=Utm, Ups=Ups, name=NN):
     '''Parse a string representing a UTM or UPS coordinate, consisting
        of C{"zone[band] hemisphere/pole easting northing"}.
@@ -91,10 +99,13 @@ def parseUTMUPS5(strUTMUPS, datum=Datums.WGS84, Utm=Utm, Ups=Ups, name=NN):
        @see: Functions L{parseUTM5} and L{parseUPS5}.
     '''
     try:
-        try:
-            u = parseUTM5(strUTMUPS, datum=datum, Utm=Utm, name=name)
-        except UTMError:
+        if isstr(strUTMUPS) and _isUPSzone(strUTMUPS):
             u = parseUPS5(strUTMUPS, datum=datum, Ups=Ups, name=name)
+        else:
+            try:
+                u = parseUTM5(strUTMUPS, datum=datum, Utm=Utm, name=name)
+            except UTMError:
+                u = parseUPS5(strUTMUPS, datum=datum, Ups=Ups, name=name)
         return u
 
     except (UTMError, UPSError) as x:
@@ -142,7 +153,7 @@ def toUtmUps8(latlon, lon=None, datum=None, falsed=True, Utm=Utm, Ups=Ups,
     lat, lon, d, name = _to4lldn(latlon, lon, datum, name)
     z, B, p, lat, lon = utmupsZoneBand5(lat, lon)
 
-    f = falsed and _xkwds_get(cmoff, cmoff=True)
+    f = bool(falsed) and (cmoff.get('cmoff', True) if cmoff else True)
     if z == _UPS_ZONE:
         u = toUps8(lat, lon, datum=d, falsed=f, Ups=Ups, pole=pole or p, name=name)
     else:
@@ -150,6 +161,69 @@ def toUtmUps8(latlon, lon=None, datum=None, falsed=True, Utm=Utm, Ups=Ups,
     return u
 
 
+def toUtmUps8_array(lats, lons, datum=Datums.WGS84, falsed=True, pole=NN,
+                                                                 name=NN):
+    '''Convert arrays of lat- and longitudes to UTM or UPS coordinates,
+       all in a single, vectorized pass.
+
+       @arg lats: Latitudes (C{degrees}), an array-like of C{float}s.
+       @arg lons: Longitudes (C{degrees}), an array-like of C{float}s
+                  of the same shape as B{C{lats}}.
+       @kwarg datum: Optional datum to use (L{Datum}).
+       @kwarg falsed: False both easting and northing (C{bool}).
+       @kwarg pole: Optional top/center of UPS (stereographic)
+                    projection (C{str}, C{'N[orth]'} or C{'S[outh]'}).
+       @kwarg name: Optional name (C{str}).
+
+       @return: A L{UtmUps8Tuple}C{(zone, hemipole, easting, northing,
+                band, datum, convergence, scale)} with C{numpy} arrays
+                of the B{C{lats}} shape for all items except C{datum}.
+
+       @raise ImportError: Package U{numpy<https://PyPI.org/project/numpy>}
+                           not found or not installed.
+
+       @raise LenError: Mismatch of B{C{lats}} and B{C{lons}} shape.
+
+       @raise RangeError: A B{C{lats}} or B{C{lons}} value outside the
+                          valid range or non-finite.
+
+       @note: Results may differ from function L{toUtmUps8} in the
+              last few decimals.
+
+       @see: Function L{toUtmUps8}.
+    '''
+    import numpy as np
+
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    if lats.shape != lons.shape:
+        raise LenError(toUtmUps8_array, lats=lats.shape, lons=lons.shape)
+
+    i = np.flatnonzero(~np.isfinite(lats) | (np.abs(lats) > 90))
+    if i.size:
+        raise RangeError(lat=float(lats.flat[i[0]]), txt=_outside_)
+    i = np.flatnonzero(~np.isfinite(lons) | (np.abs(lons) > 180))
+    if i.size:
+        raise RangeError(lon=float(lons.flat[i[0]]), txt=_outside_)
+    lons = np.mod(lons + 180, 360) - 180  # [-180, 180) like _to3zll
+
+    d = datum or Datums.WGS84
+    s, E = lats.shape, d.ellipsoid
+    r = (np.empty(s, dtype=int), np.empty(s, dtype='U1'), np.empty(s),
+         np.empty(s), np.empty(s, dtype='U1'), np.empty(s), np.empty(s))
+
+    P = (lats < _UTM_LAT_MIN) | (lats >= _UTM_LAT_MAX)  # UPS, [-80, 84) UTM
+    for m, _vec, kwds in ((~P, _toUtm_vec, {}),
+                          ( P, _toUps_vec, dict(pole=pole))):
+        if m.any():
+            for a, v in zip(r, _vec(lats[m], lons[m], E, falsed, **kwds)):
+                a[m] = v
+
+    z, h, e, n, B, c, k = r
+    r = UtmUps8Tuple(z, h, e, n, B, d, c, k)
+    return _xnamed(r, name)
+
+
 def UtmUps(zone, hemipole, easting, northing, band=NN, datum=Datums.WGS84,
                                               falsed=True, name=NN):
     '''Class-like function to create a UTM/UPS coordinate.
@@ -175,11 +249,23 @@ def UtmUps(zone, hemipole, easting, northing, band=NN, datum=Datums.WGS84,
        @see: Classes L{Utm} and L{Ups} and Karney's U{UTMUPS
              <https://GeographicLib.SourceForge.io/html/classGeographicLib_1_1UTMUPS.html>}.
     '''
-    z, B, hp = _to3zBhp(zone, band, hemipole=hemipole)
+    z, B, hp = _to3zBhp(zone, band, hemipole)
     U = Ups if z in (_UPS_ZONE, _UPS_ZONE_STR) else Utm
     return U(z, hp, easting, northing, band=B, datum=datum, falsed=falsed, name=name)
 
 
+def _en(en, lo, hi, ename, U, Error):
+    '''(INTERNAL) Check a UTM or UPS easting or northing.
+    '''
+    try:
+        if lo <= float(en) <= hi:
+            return
+    except (TypeError, ValueError):
+        pass
+    t = '%s %s %s [%.0F %.0F]' % (_outside_, U, _range_, lo, hi)
+    raise Error(ename, en, txt=t)
+
+
 def utmupsValidate(coord, falsed=False, MGRS=False, Error=UTMUPSError):
     '''Check a UTM or UPS coordinate.
 
@@ -196,16 +282,6 @@ def utmupsValidate(coord, falsed=False, MGRS=False, Error=UTMUPSError):
        @see: Function L{utmupsValidateOK}.
     '''
 
-    def _en(en, lo, hi, ename):  # U, Error
-        try:
-            if lo <= float(en) <= hi:
-                return
-        except (TypeError, ValueError):
-            pass
-        t = _SPACE_.join((_outside_, U, _range_, '[%.0F' % (lo,),
-                                                 '%.0F]' % (hi,)))
-        raise Error(ename, en, txt=t)
-
     if isinstance(coord, (Ups, Utm)):
         zone = coord.zone
         hemi = coord.hemisphere
@@ -222,14 +298,12 @@ def utmupsValidate(coord, falsed=False, MGRS=False, Error=UTMUPSError):
         raise _IsnotError(Error=Error, coord=coord, *map1(modulename,
                           Utm, Ups, UtmUps5Tuple, UtmUps8Tuple))
 
-    z, B, h = _to3zBhp(zone, band, hemipole=hemi)
+    z, B, h = _to3zBhp(zone, band, hemi)
 
     if z == _UPS_ZONE:  # UPS
-        import pygeodesy.ups as u  # PYCHOK expected
-        U, M = _UPS_, _UpsMinMax
+        U, R, Bs = _UPS_, _UPS_RANGES, _UPS_Bands
     else:  # UTM
-        import pygeodesy.utm as u  # PYCHOK expected
-        U, M = _UTM_, _UtmMinMax
+        U, R, Bs = _UTM_, _UTM_RANGES, _UTM_Bands
 
     if MGRS:
         U, s = _MGRS_, _MGRS_TILE
@@ -239,13 +313,65 @@ def utmupsValidate(coord, falsed=False, MGRS=False, Error=UTMUPSError):
     i = _NS_.find(h)
     if i < 0 or z < _UTMUPS_ZONE_MIN \
              or z > _UTMUPS_ZONE_MAX \
-             or B not in u._Bands:
+             or B not in Bs:
         t = '%s(%s%s %s)' % (U, z,B, h)
         raise Error(coord=t, zone=zone, band=band, hemisphere=hemi)
 
     if enMM:
-        _en(e, M.eMin[i] - s, M.eMax[i] + s, _easting_)   # PYCHOK .eMax .eMin
-        _en(n, M.nMin[i] - s, M.nMax[i] + s, _northing_)  # PYCHOK .nMax .nMin
+        eMin, eMax, nMin, nMax = R[i]
+        _en(e, eMin - s, eMax + s, _easting_, U, Error)
+        _en(n, nMin - s, nMax + s, _northing_, U, Error)
+
+
+def utmupsValidate_array(zones, hemipoles, eastings, northings, bands,
+                                            MGRS=False):
+    '''Check arrays of I{falsed} UTM and UPS coordinates, all in a
+       single, vectorized pass.
+
+       @arg zones: UTM zones C{1..60} or UPS zone C{0}, an array-like
+                   of C{int}s.
+       @arg hemipoles: UTM hemispheres or UPS poles, an array-like of
+                       C{str}s C{'N[orth]'} or C{'S[outh]'}.
+       @arg eastings: Falsed eastings (C{meter}), an array-like of
+                      C{float}s.
+       @arg northings: Falsed northings (C{meter}), an array-like of
+                       C{float}s.
+       @arg bands: UTM or UPS Band letters, an array-like of C{str}s.
+       @kwarg MGRS: Increase easting and northing ranges (C{bool}).
+
+       @return: The indices of the invalid coordinates (C{numpy}
+                array of C{int}s), empty if all passed validation.
+
+       @raise ImportError: Package U{numpy<https://PyPI.org/project/numpy>}
+                           not found or not installed.
+
+       @raise LenError: Mismatch of the array shapes.
+
+       @see: Function L{utmupsValidate}.
+    '''
+    import numpy as np
+
+    z = np.asarray(zones, dtype=int).ravel()
+    h = np.char.upper(np.asarray(hemipoles, dtype='U1')).ravel()
+    e = np.asarray(eastings,  dtype=float).ravel()
+    n = np.asarray(northings, dtype=float).ravel()
+    B = np.char.upper(np.asarray(bands, dtype='U1')).ravel()
+    if not len(z) == len(h) == len(e) == len(n) == len(B):
+        raise LenError(utmupsValidate_array, zones=len(z), hemipoles=len(h),
+                       eastings=len(e), northings=len(n), bands=len(B))
+
+    P = z == _UPS_ZONE
+    S = h == _NS_[1]
+    ok = (z >= _UTMUPS_ZONE_MIN) & (z <= _UTMUPS_ZONE_MAX) & (S | (h == _NS_[0]))
+    ok &= np.where(P, np.isin(B, _UPS_Bands),  # UTM Band may be empty
+                      np.isin(B, tuple(_UTM_Bands) + (NN,)))
+
+    # rows for UTM North, South and UPS North, South
+    R = np.array(_UTM_RANGES + _UPS_RANGES)[P * 2 + S]
+    s = _MGRS_TILE if MGRS else 0
+    ok &= (e >= (R[:, 0] - s)) & (e <= (R[:, 1] + s)) & \
+          (n >= (R[:, 2] - s)) & (n <= (R[:, 3] + s))
+    return np.flatnonzero(~ok)
 
 
 def utmupsValidateOK(coord, falsed=False, ok=True):
@@ -289,10 +415,13 @@ def utmupsZoneBand5(lat, lon, cmoff=False):
 
        @see: Functions L{utmZoneBand5} and L{upsZoneBand5}.
     '''
-    try:
-        return utmZoneBand5(lat, lon, cmoff=cmoff)
-    except RangeError:
-        return upsZoneBand5(lat, lon)
+    lat, lon = parseDMS2(lat, lon)
+    if _UTM_LAT_MIN <= lat < _UTM_LAT_MAX:  # [-80, 84) like Veness
+        try:
+            return utmZoneBand5(lat, lon, cmoff=cmoff)
+        except RangeError:  # PYCHOK no cover
+            pass
+    return upsZoneBand5(lat, lon)
 
 # **) MIT License
 #
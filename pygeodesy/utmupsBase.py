@@ -27,6 +27,18 @@ from pygeodesy.utily import wrap90, wrap360
 __all__ = ()
 __version__ = '20.07.08'
 
+try:
+    from functools import lru_cache as _lru_cache
+except ImportError:  # PYCHOK no cover, Python 2-
+
+    def _lru_cache(**unused):  # PYCHOK expected
+        '''(INTERNAL) No-op C{functools.lru_cache} decorator.
+        '''
+        def _wrapped(f):
+            f.__wrapped__ = f
+            return f
+        return _wrapped
+
 _MGRS_TILE =  100e3  # PYCHOK block size (C{meter})
 
 _UTM_LAT_MAX      =  84  # PYCHOK for export (C{degrees})
@@ -92,6 +104,20 @@ def _to3zBhp(zone, band, hemipole=NN, Error=_ValueError):  # imported by .epsg,
 
        @raise ValueError: Invalid B{C{zone}}, B{C{band}} or B{C{hemipole}}.
     '''
+    try:
+        z, B, hp, t = _to4zBht(zone, band, hemipole)
+    except TypeError:  # unhashable, not cached
+        z, B, hp, t = _to4zBht.__wrapped__(zone, band, hemipole)
+    if t:
+        raise Error(zone=zone, band=B, hemipole=hemipole, txt=t)
+    return Zone(z), Band(B), hp
+
+
+@_lru_cache(maxsize=1024)
+def _to4zBht(zone, band, hemipole):
+    '''(INTERNAL) Cached C{_to3zBhp}, returning plain C{int} and
+       C{str}s plus the error text, C{NN} if valid.
+    '''
     try:
         B, z = band, _UTMUPS_ZONE_INVALID
         if isscalar(zone):
@@ -109,17 +135,16 @@ def _to3zBhp(zone, band, hemipole=NN, Error=_ValueError):  # imported by .epsg,
         if _UTMUPS_ZONE_MIN <= z <= _UTMUPS_ZONE_MAX:
             hp = hemipole[:1].upper()
             if hp in _NS_ or not hp:
-                z = Zone(z)
-                B = Band(B.upper())
+                B = B.upper()
                 if B.isalpha():
-                    return z, B, (hp or _NS_[B < _N_])
+                    return z, B, (hp or _NS_[B < _N_]), NN
                 elif not B:
-                    return z, B, hp
+                    return z, B, hp, NN
 
         t = _invalid_
     except (AttributeError, IndexError, TypeError, ValueError) as x:
         t = str(x)  # no Python 3+ exception chaining
-    raise Error(zone=zone, band=B, hemipole=hemipole, txt=t)
+    return z, B, hemipole, t
 
 
 def _to3zll(lat, lon):  # imported by .ups, .utm
@@ -10,6 +10,7 @@
 from base import clips, coverage, isiOS, PyGeodesy_dir, PythonX, \
                  secs2str, test_dir, tilde, versions  # PYCHOK expected
 
+from collections import deque as _deque
 from os import access, environ, F_OK, linesep as NL
 import sys
 
@@ -67,6 +68,19 @@ if isiOS:  # MCCABE 14
         return x, r
 
     PythonX_O = basename(PythonX)
+    _Pool = None  # tests are run in this same process
+
+    def _kill():
+        '''(INTERNAL) No test processes to kill.
+        '''
+        pass
+
+    def _stream2(test, *opts):
+        '''(INTERNAL) Invoke one test module and return a callable
+           for the exit status and the console output lines.
+        '''
+        x, r = run2(test, *opts)
+        return (lambda: x), r.splitlines(True)
 
 else:  # non-iOS
 
@@ -80,18 +94,49 @@ else:  # non-iOS
         pythonC_  += ('-O',)
     if coverage and environ.get('PYGEODESY_COVERAGE', ''):
         pythonC_ += tuple('-m coverage run -a'.split())
+        _Pool = None  # don't append coverage data concurrently
+    else:  # run tests in parallel, each in a separate process
+        try:
+            from concurrent.futures import ThreadPoolExecutor as _Pool
+        except ImportError:  # Python 2-
+            _Pool = None
+
+    from threading import Lock
+    _Popens = []  # started test processes, None once killed
+    _Popens_lock = Lock()
+
+    def _kill():
+        '''(INTERNAL) Kill all running test processes and
+           prevent any further ones from being started.
+        '''
+        global _Popens
+        with _Popens_lock:
+            ps, _Popens = _Popens, None
+        for p in (ps or ()):
+            if p.poll() is None:
+                p.kill()
+
+    def _popen(test, *opts):
+        '''(INTERNAL) Start one test module.
+        '''
+        c = pythonC_ + (test,) + opts
+        with _Popens_lock:
+            if _Popens is None:  # killed
+                raise RuntimeError('killed')
+            p = Popen(c, creationflags=0,
+                         executable   =sys.executable,
+                       # shell        =True,
+                         stdin        =None,
+                         stdout       =PIPE,  # XXX
+                         stderr       =STDOUT)  # XXX
+            _Popens.append(p)
+        return p
 
     def run2(test, *opts):  # PYCHOK expected
         '''Invoke one test module and return
            the exit status and console output.
         '''
-        c = pythonC_ + (test,) + opts
-        p = Popen(c, creationflags=0,
-                     executable   =sys.executable,
-                   # shell        =True,
-                     stdin        =None,
-                     stdout       =PIPE,  # XXX
-                     stderr       =STDOUT)  # XXX
+        p = _popen(test, *opts)
 
         r = p.communicate()[0]
         if isinstance(r, bytes):  # Python 3+
@@ -101,14 +146,34 @@ else:  # non-iOS
         # test failures in the tested module
         return p.returncode, r
 
+    def _stream2(test, *opts):  # PYCHOK expected
+        '''(INTERNAL) Invoke one test module and return a callable
+           for the exit status and the console output lines, streamed
+           while the test module is running.
+        '''
+        p = _popen(test, *opts)
+
+        def _lines(stdout):
+            try:
+                for t in stdout:
+                    yield t.decode('utf-8')
+            finally:
+                stdout.close()
+
+        # the exit status reflects the number of
+        # test failures in the tested module
+        return p.wait, _lines(p.stdout)
+
 # shorten Python path [-O]
 PythonX_O = clips(PythonX_O, 32)
 
 # command line options
 _failedonly = False
+_jobs       = 0  # default cpu_count()
 _raiser     = False
 _results    = False  # or file
 _verbose    = False
+_TAIL  = 64  # output lines kept before a Traceback
 _Total = 0  # total tests
 _FailX = 0  # failed tests
 
@@ -123,21 +188,20 @@ def _exit(last, text, exit):
     sys.exit(exit)
 
 
-def _run(test, *opts):  # MCCABE 13
-    '''(INTERNAL) Run a test script and parse the result.
+def _run(arg, x, n, tb, ts, r):  # MCCABE 13
+    '''(INTERNAL) Report the result of a test script.
     '''
     global _Total, _FailX
 
-    t = 'running %s %s' % (PythonX_O, tilde(test))
-    if access(test, F_OK):
+    t = 'running %s %s' % (PythonX_O, tilde(arg.split()[0]))
+    if r is not None:
 
         print(t)
-        x, r = run2(test, *opts)
         if _results:
             _write(NL + t + NL)
             _write(r)
 
-        if 'Traceback' in r:
+        if tb:
             print(r + NL)
             if not x:  # count as failure
                 _FailX += 1
@@ -145,7 +209,7 @@ def _run(test, *opts):  # MCCABE 13
                 raise SystemExit
 
         elif _failedonly:
-            for t in _testlines(r):
+            for t in ts:
                 if ', KNOWN' not in t:
                     print(t)
 
@@ -153,27 +217,57 @@ def _run(test, *opts):  # MCCABE 13
             print(r + NL)
 
         elif x:
-            for t in _testlines(r):
+            for t in ts:
                 print(t)
 
     else:
         r = t + ' FAILED:  no such file' + NL
-        x = 1
         if _results:
             _write(NL + r)
         print(r)
 
-    _Total += r.count(NL + '    test ')  # number of tests
+    _Total += n  # number of tests
     _FailX += x  # failures, excluding KNOWN ones
 
 
-def _testlines(r):
-    '''(INTERNAL) Yield test lines.
+def _run2(arg):
+    '''(INTERNAL) Run a test script with options and parse the
+       console output while streamed, see L{_parse4}.
+
+       @return: 5-Tuple (exit status, number of tests, Traceback,
+                test lines, output) or C{(1, 0, False, [], None)}
+                if the test script is missing.
     '''
-    for t in r.split(NL):
+    test_opts = arg.split()
+    if access(test_opts[0], F_OK):
+        wait, lines = _stream2(*test_opts)
+        n, tb, ts, r = _parse4(lines, _results or _verbose)
+        return wait(), n, tb, ts, r
+    return 1, 0, False, [], None
+
+
+def _parse4(lines, keep):
+    '''(INTERNAL) Parse the test output lines in a single pass and
+       return 4-tuple (number of tests, Traceback, test lines, output).
+
+       The output is kept in full if B{C{keep}} is C{True}, otherwise
+       only the last L{_TAIL} lines before and all lines from the first
+       Traceback, if any, and returned as empty string without one.
+    '''
+    n, tb, ts = 0, False, []
+    rs = [] if keep else _deque(maxlen=_TAIL)
+    for t in lines:
+        if t.startswith('    test '):
+            n += 1
         if 'FAILED,' in t or 'passed' in t or 'SKIPPED' in t:
-            yield t.rstrip()
-    yield ''
+            ts.append(t.rstrip())
+        if not tb and 'Traceback' in t:
+            tb = True
+            if not keep:  # keep all from here
+                rs = list(rs)
+        rs.append(t)
+    ts.append('')
+    return n, tb, ts, (''.join(rs) if keep or tb else '')
 
 
 def _write(text):
@@ -193,12 +287,14 @@ if __name__ == '__main__':  # MCCABE 19
     while args and args[0].startswith('-'):
         arg = args.pop(0)
         if '-help'.startswith(arg):
-            print('usage: %s [-B] [-failedonly] [-raiser] [-results] [-verbose] [-Z[0-9]] [test/test...py ...]' % (argv0,))
+            print('usage: %s [-B] [-failedonly] [-J[0-9]] [-raiser] [-results] [-verbose] [-Z[0-9]] [test/test...py ...]' % (argv0,))
             sys.exit(0)
         elif arg.startswith('-B'):
             environ['PYTHONDONTWRITEBYTECODE'] = arg[2:]
         elif '-failedonly'.startswith(arg):
             _failedonly = True
+        elif arg.startswith('-J'):
+            _jobs = int(arg[2:] or 0)  # number of parallel tests
         elif '-raiser'.startswith(arg):
             _raiser = True  # break on error
         elif '-results'.startswith(arg):
@@ -224,10 +320,26 @@ if __name__ == '__main__':  # MCCABE 19
         _results = open(t, 'wb')  # note, 'b' not 't'!
         _write('%s typical test results (%s)%s' % (argv0, v, NL))
 
+    if _Pool and not _jobs:
+        from multiprocessing import cpu_count
+        _jobs = cpu_count()
+
     s = time()
     try:
-        for arg in args:
-            _run(*arg.split())
+        if _Pool and _jobs > 1 and len(args) > 1:
+            p = _Pool(max_workers=_jobs)
+            fs = [p.submit(_run2, arg) for arg in args]
+            try:  # report in order, for -raiser
+                for arg, f in zip(args, fs):
+                    _run(arg, *f.result())
+            finally:
+                for f in fs:
+                    f.cancel()
+                _kill()  # running tests, if any
+                p.shutdown()
+        else:
+            for arg in args:
+                _run(arg, *_run2(arg))
     except KeyboardInterrupt:
         _exit('', '^C', 9)
     except SystemExit:
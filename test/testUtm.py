@@ -8,7 +8,8 @@ __version__ = '20.04.27'  # '19.10.31'
 
 from base import TestsBase
 
-from pygeodesy import EPS, F_DEG, F_DMS, fstr, parseUTM5, toUtm8, Utm
+from pygeodesy import EPS, F_DEG, F_DMS, fstr, parseUTM5, RangeError, \
+                      toUtm8, Utm
 
 
 class Tests(TestsBase):
@@ -140,6 +141,13 @@ class Tests(TestsBase):
             ll = fstr(u.toLatLon(eps=eps)[:2], prec=8)
             self.test('Utm111.toLatLon(eps=%.4e)' % (eps,), ll, '70.54298527, 40.28205459')
 
+        for lon in (90, -90):  # 90 degrees off, singular
+            try:
+                u = toUtm8(0, lon, falsed=False)
+            except RangeError as x:
+                u = str(x)
+            self.test('toUtm8(0, %s, falsed=False)' % (lon,), u, "lon ('%.1f°'): outside UTM range" % (lon,))
+
 
 if __name__ == '__main__':
 
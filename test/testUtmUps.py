@@ -6,10 +6,32 @@
 __all__ = ('Tests',)
 __version__ = '20.04.22'
 
-from base import TestsBase
+from base import isiOS, numpy, PyGeodesy_dir, PythonX, test_dir, \
+                 TestsBase
 
-from pygeodesy import F_DMS, parseUTMUPS5, toUps8, toUtmUps8, \
-                      utmups, UtmUps, utmupsValidateOK
+from os import environ
+
+from pygeodesy import F_DMS, parseUTMUPS5, RangeError, toUps8, toUtmUps8, \
+                      toUtmUps8_array, utmups, UtmUps, utmupsValidate_array, \
+                      utmupsValidateOK
+
+
+_lats = 61.2, 83.627, -79, 84, -13.4125, 72, 56.5, -87.29
+_lons = -149.9, -32.664, -79, 84, -103.8667, 10, 4, 132.25
+
+
+def _utmups8strs(lats=_lats, lons=_lons):
+    '''Format L{toUtmUps8} and L{toUtmUps8_array} results.
+    '''
+    t, f = [], '%02d%s %s %.6f %.6f %.8f %.8f'
+    r = toUtmUps8_array(lats, lons)
+    for i, ll in enumerate(zip(lats, lons)):
+        u = toUtmUps8(*ll, Utm=None, Ups=None)
+        t.append(f % (u.zone, u.band, u.hemipole, u.easting, u.northing,
+                      u.convergence, u.scale))
+        t.append(f % (r.zone[i], r.band[i], r.hemipole[i], r.easting[i],
+                      r.northing[i], r.convergence[i], r.scale[i]))
+    return t
 
 
 class Tests(TestsBase):
@@ -193,6 +215,74 @@ class Tests(TestsBase):
         self.test('parseUTMUPS5', u, "(31, 'N', 446000.0, 8436100.0, 'X')")
         u = parseUTMUPS5('00A S 506346 1057743', Utm=None, Ups=None)
         self.test('parseUTMUPS5', u, "(0, 'S', 506346.0, 1057743.0, 'A')")
+        u = parseUTMUPS5('001 N 500000 5000000', Utm=None, Ups=None)  # zero-padded UTM zone
+        self.test('parseUTMUPS5', u, "(1, 'N', 500000.0, 5000000.0, '')")
+
+    def testUtmUps8_array(self):
+
+        lats, lons = _lats, _lons
+        for f in (True, False):
+            r = toUtmUps8_array(lats, lons, falsed=f)
+            self.test('toUtmUps8_array', len(r.zone), len(lats))
+            for i, ll in enumerate(zip(lats, lons)):
+                u = toUtmUps8(*ll, falsed=f, Utm=None, Ups=None)
+                n = 'toUtmUps8_array[%d] falsed=%s' % (i, f)
+                self.test(n, '%02d%s %s' % (r.zone[i], r.band[i], r.hemipole[i]),
+                             '%02d%s %s' % (u.zone, u.band, u.hemipole))
+                self.test(n, '%.6f %.6f' % (r.easting[i], r.northing[i]),
+                             '%.6f %.6f' % (u.easting, u.northing))
+                self.test(n, '%.8f %.8f' % (r.convergence[i], r.scale[i]),
+                             '%.8f %.8f' % (u.convergence, u.scale))
+
+        r = toUtmUps8_array(lats, lons, datum=None)
+        self.test('toUtmUps8_array datum', r.datum.name, 'WGS84')
+        for ll in (((0, numpy.nan), (0, 0)), ((0, 0), (numpy.inf, 0)), ((0, 1), (0, 323.9))):
+            try:
+                t = toUtmUps8_array(*ll)
+            except RangeError as x:
+                t = x.__class__.__name__
+            self.test('toUtmUps8_array', t, RangeError.__name__)
+        r = toUtmUps8_array(lats, lons)
+
+        x = utmupsValidate_array(r.zone, r.hemipole, r.easting, r.northing, r.band)
+        self.test('utmupsValidate_array', len(x), 0)
+        e = r.easting.copy()
+        e[1] = 0
+        e[3] = -1
+        x = utmupsValidate_array(r.zone, r.hemipole, e, r.northing, r.band)
+        self.test('utmupsValidate_array', x.tolist(), [1, 3])
+        x = utmupsValidate_array(r.zone, r.hemipole, e, r.northing, r.band, MGRS=True)
+        self.test('utmupsValidate_array', x.tolist(), [3])
+        B = r.band.copy()
+        B[0] = 'A'
+        B[3] = 'C'
+        x = utmupsValidate_array(r.zone, r.hemipole, r.easting, r.northing, B)
+        self.test('utmupsValidate_array', x.tolist(), [0, 3])
+
+    def testUtmUps8_numba(self):
+        # numba is only imported with env variable PYGEODESY_NUMBA
+        # set, run the njit kernel and the gufunc in a sub-process
+        from subprocess import PIPE, STDOUT, Popen
+
+        c = ('from pygeodesy import utm',
+             'from testUtmUps import _utmups8strs',
+             'if utm._toUtm4_gu and hasattr(utm._toUtm4, "py_func"):',
+             '    print("\\n".join(_utmups8strs()))')
+        env = dict(environ, PYGEODESY_NUMBA='1', PYTHONPATH=PyGeodesy_dir)
+        p = Popen((PythonX, '-c', '\n'.join(c)), cwd=test_dir, env=env,
+                   stdout=PIPE, stderr=STDOUT)
+        r = p.communicate()[0]
+        if isinstance(r, bytes):  # Python 3+
+            r = r.decode('utf-8')
+        r, xs = r.strip(), _utmups8strs()
+        if r:
+            r = r.split('\n')
+            self.test('numba', p.returncode, 0)
+            self.test('numba', len(r), len(xs))
+            for i, (t, x) in enumerate(zip(r, xs)):
+                self.test('numba[%d]' % (i,), t.rstrip(), x)
+        else:
+            self.skip('no numba', n=len(xs) + 2)
 
 
 if __name__ == '__main__':
@@ -201,5 +291,9 @@ if __name__ == '__main__':
 
     t = Tests(__file__, __version__, utmups)
     t.testUtmUps(ellipsoidalVincenty.LatLon)
+    if numpy:
+        t.testUtmUps8_array()
+        if not isiOS:
+            t.testUtmUps8_numba()
     t.results()
     t.exit()